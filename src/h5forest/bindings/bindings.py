@@ -6,7 +6,6 @@ module should not be called directly, but are intended to be used by the main
 application.
 """
 
-from prompt_toolkit.filters import Condition
 from prompt_toolkit.layout import ConditionalContainer
 from prompt_toolkit.widgets import Label
 
@@ -68,48 +67,32 @@ def _init_app_bindings(app):
         event.app.invalidate()
 
     # Bind the functions
-    app.kb.add("q", filter=Condition(lambda: app.flag_normal_mode))(exit_app)
+    app.kb.add("q", filter=app.filter_normal_mode)(exit_app)
     app.kb.add("c-q")(exit_app)
-    app.kb.add("j", filter=Condition(lambda: app.flag_normal_mode))(
-        jump_leader_mode
-    )
-    app.kb.add("d", filter=Condition(lambda: app.flag_normal_mode))(
-        dataset_leader_mode
-    )
-    app.kb.add("w", filter=Condition(lambda: app.flag_normal_mode))(
-        window_leader_mode
-    )
-    app.kb.add("p", filter=Condition(lambda: app.flag_normal_mode))(
-        plotting_leader_mode
-    )
-    app.kb.add("h", filter=Condition(lambda: app.flag_normal_mode))(
-        hist_leader_mode
-    )
-    app.kb.add("q", filter=Condition(lambda: not app.flag_normal_mode))(
-        exit_leader_mode
-    )
+    app.kb.add("j", filter=app.filter_normal_mode)(jump_leader_mode)
+    app.kb.add("d", filter=app.filter_normal_mode)(dataset_leader_mode)
+    app.kb.add("w", filter=app.filter_normal_mode)(window_leader_mode)
+    app.kb.add("p", filter=app.filter_normal_mode)(plotting_leader_mode)
+    app.kb.add("h", filter=app.filter_normal_mode)(hist_leader_mode)
+    app.kb.add("q", filter=~app.filter_normal_mode)(exit_leader_mode)
     app.kb.add(
         "A",
-        filter=Condition(
-            lambda: app.flag_normal_mode and not app.flag_expanded_attrs
-        ),
+        filter=app.filter_normal_mode & ~app.filter_expanded_attrs,
     )(expand_attributes)
     app.kb.add(
         "A",
-        filter=Condition(
-            lambda: app.flag_normal_mode and app.flag_expanded_attrs
-        ),
+        filter=app.filter_normal_mode & app.filter_expanded_attrs,
     )(collapse_attributes)
 
     # Add the hot keys
     hot_keys = [
         ConditionalContainer(
             Label("A → Expand Attributes"),
-            filter=Condition(lambda: not app.flag_expanded_attrs),
+            filter=~app.filter_expanded_attrs,
         ),
         ConditionalContainer(
             Label("A → Shrink Attributes"),
-            filter=Condition(lambda: app.flag_expanded_attrs),
+            filter=app.filter_expanded_attrs,
         ),
         Label("d → Dataset Mode"),
         Label("h → Hist Mode"),
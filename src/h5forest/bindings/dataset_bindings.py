@@ -8,9 +8,6 @@ The functions in this module should not be called directly, but are
 intended to be used by the main application.
 """
 
-import threading
-
-from prompt_toolkit.filters import Condition
 from prompt_toolkit.layout.containers import VSplit
 from prompt_toolkit.widgets import Label
 
@@ -72,11 +69,11 @@ def _init_dataset_bindings(app):
                 [s.strip() for s in app.user_input.split("-")]
             )
 
-            # Attempt to convert to an int
-            try:
-                start_index = int(string_values[0])
-                end_index = int(string_values[1])
-            except ValueError:
+            # Validate the input up front, we need exactly two non-negative
+            # integers (this also catches a missing "-")
+            if len(string_values) != 2 or not all(
+                s.isdecimal() for s in string_values
+            ):
                 app.print(
                     "Invalid input! Input must be a integers "
                     f"separated by -, not ({app.user_input})"
@@ -87,6 +84,9 @@ def _init_dataset_bindings(app):
                 app.return_to_normal_mode()
                 return
 
+            # Convert to integers
+            start_index, end_index = map(int, string_values)
+
             # Return focus to the tree
             app.default_focus()
 
@@ -136,9 +136,13 @@ def _init_dataset_bindings(app):
             app.print(f"{node.path} is not a Dataset")
             return
 
-        def run_in_thread():
+        def run_in_thread(stop_event):
             # Get the value string
-            vmin, vmax = node.get_min_max()
+            vmin, vmax = node.get_min_max(stop_event)
+
+            # Nothing to report if we were stopped part way through
+            if stop_event.is_set():
+                return
 
             # Print the result on the main thread
             app.app.loop.call_soon_threadsafe(
@@ -149,8 +153,8 @@ def _init_dataset_bindings(app):
             # Exit values mode
             app.return_to_normal_mode()
 
-        # Start the operation in a new thread
-        threading.Thread(target=run_in_thread, daemon=True).start()
+        # Start the operation in a background worker
+        app.start_worker(run_in_thread)
 
     @error_handler
     def mean(event):
@@ -163,9 +167,13 @@ def _init_dataset_bindings(app):
             app.print(f"{node.path} is not a Dataset")
             return
 
-        def run_in_thread():
+        def run_in_thread(stop_event):
             # Get the value string
-            vmean = node.get_mean()
+            vmean = node.get_mean(stop_event)
+
+            # Nothing to report if we were stopped part way through
+            if stop_event.is_set():
+                return
 
             # Print the result on the main thread
             app.app.loop.call_soon_threadsafe(
@@ -176,8 +184,8 @@ def _init_dataset_bindings(app):
             # Exit values mode
             app.return_to_normal_mode()
 
-        # Start the operation in a new thread
-        threading.Thread(target=run_in_thread, daemon=True).start()
+        # Start the operation in a background worker
+        app.start_worker(run_in_thread)
 
     @error_handler
     def std(event):
@@ -190,9 +198,13 @@ def _init_dataset_bindings(app):
             app.print(f"{node.path} is not a Dataset")
             return
 
-        def run_in_thread():
+        def run_in_thread(stop_event):
             # Get the value string
-            vstd = node.get_std()
+            vstd = node.get_std(stop_event)
+
+            # Nothing to report if we were stopped part way through
+            if stop_event.is_set():
+                return
 
             # Print the result on the main thread
             app.app.loop.call_soon_threadsafe(
@@ -203,24 +215,16 @@ def _init_dataset_bindings(app):
             # Exit values mode
             app.return_to_normal_mode()
 
-        # Start the operation in a new thread
-        threading.Thread(target=run_in_thread, daemon=True).start()
+        # Start the operation in a background worker
+        app.start_worker(run_in_thread)
 
     # Bind the functions
-    app.kb.add("v", filter=Condition(lambda: app.flag_dataset_mode))(
-        show_values
-    )
-    app.kb.add("V", filter=Condition(lambda: app.flag_dataset_mode))(
-        show_values_in_range
-    )
-    app.kb.add("c", filter=Condition(lambda: app.flag_dataset_mode))(
-        close_values
-    )
-    app.kb.add("m", filter=Condition(lambda: app.flag_dataset_mode))(
-        minimum_maximum
-    )
-    app.kb.add("M", filter=Condition(lambda: app.flag_dataset_mode))(mean)
-    app.kb.add("s", filter=Condition(lambda: app.flag_dataset_mode))(std)
+    app.kb.add("v", filter=app.filter_dataset_mode)(show_values)
+    app.kb.add("V", filter=app.filter_dataset_mode)(show_values_in_range)
+    app.kb.add("c", filter=app.filter_dataset_mode)(close_values)
+    app.kb.add("m", filter=app.filter_dataset_mode)(minimum_maximum)
+    app.kb.add("M", filter=app.filter_dataset_mode)(mean)
+    app.kb.add("s", filter=app.filter_dataset_mode)(std)
 
     # Add the hot keys
     hot_keys = VSplit(
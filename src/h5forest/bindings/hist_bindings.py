@@ -147,9 +147,9 @@ def _init_hist_bindings(app):
         "enter",
         filter=Condition(lambda: app.app.layout.has_focus(app.hist_content)),
     )(edit_hist_entry)
-    app.kb.add("h", filter=Condition(lambda: app.flag_hist_mode))(plot_hist)
-    app.kb.add("H", filter=Condition(lambda: app.flag_hist_mode))(save_hist)
-    app.kb.add("r", filter=Condition(lambda: app.flag_hist_mode))(reset_hist)
+    app.kb.add("h", filter=app.filter_hist_mode)(plot_hist)
+    app.kb.add("H", filter=app.filter_hist_mode)(save_hist)
+    app.kb.add("r", filter=app.filter_hist_mode)(reset_hist)
     app.kb.add(
         "e",
         filter=Condition(
@@ -8,7 +8,6 @@ This should not be used directly, but instead provides the functions for the
 application.
 """
 
-from prompt_toolkit.filters import Condition
 from prompt_toolkit.layout import VSplit
 from prompt_toolkit.widgets import Label
 
@@ -29,8 +28,11 @@ def _init_jump_bindings(app):
     @error_handler
     def jump_to_bottom(event):
         """Jump to the bottom of the tree."""
+        # Jump straight to the start of the final row (rather than the end
+        # of the text which is past the final row)
         app.set_cursor_position(
-            app.tree.tree_text, new_cursor_pos=app.tree.length
+            app.tree.tree_text,
+            new_cursor_pos=app.tree.row_offset(app.tree.height - 1),
         )
 
         # Exit jump mode
@@ -51,21 +53,11 @@ def _init_jump_bindings(app):
             app.return_to_normal_mode()
             return
 
-        # Get position of the first character in this row
-        pos = app.current_position - app.current_column
+        # Find the parent's row (it must be above the current row)
+        row = app.tree.nodes_by_row.index(parent, 0, app.current_row)
 
-        # Loop backwards until we hit the parent
-        for row in range(app.current_row - 1, -1, -1):
-            # Compute the position at this row
-            pos -= len(app.tree.tree_text_split[row]) + 1
-
-            # If we are at the parent stop
-            if app.tree.get_current_node(row) is parent:
-                break
-
-        # Safety check, avoid doing something stupid
-        if pos < 0:
-            pos = 0
+        # Get the position of the first character in the parent's row
+        pos = app.tree.row_offset(row)
 
         # Move the cursor
         app.set_cursor_position(app.tree.tree_text, pos)
@@ -82,29 +74,32 @@ def _init_jump_bindings(app):
         depth = node.depth
         target_depth = depth - 1 if depth > 0 else 0
 
-        # Get the position of the first character in this row
-        pos = app.current_position - app.current_column
-
         # Do nothing if we are at the end
         if app.current_row == app.tree.height - 1:
             app.return_to_normal_mode()
             return
 
-        # Loop forwards until we hit the next node at the level above
-        # this node's depth. If at the root just move to the next
-        # root group.
-        for row in range(app.current_row, app.tree.height):
-            # Compute the position at this row
-            pos += len(app.tree.tree_text_split[row]) + 1
+        # Find the next node at the level above this node's depth. If at
+        # the root just move to the next root group.
+        row = next(
+            (
+                row
+                for row, next_node in enumerate(
+                    app.tree.nodes_by_row[app.current_row + 1 :],
+                    start=app.current_row + 1,
+                )
+                if next_node.depth == target_depth
+            ),
+            None,
+        )
 
-            # Ensure we don't over shoot
-            if row + 1 > app.tree.height:
-                app.return_to_normal_mode()
-                return
+        # Ensure we don't over shoot
+        if row is None:
+            app.return_to_normal_mode()
+            return
 
-            # If we are at the next node stop
-            if app.tree.get_current_node(row + 1).depth == target_depth:
-                break
+        # Get the position of the first character in the next node's row
+        pos = app.tree.row_offset(row)
 
         # Move the cursor
         app.set_cursor_position(app.tree.tree_text, pos)
@@ -120,32 +115,24 @@ def _init_jump_bindings(app):
             # Unpack user input
             key = app.user_input.strip()
 
-            # Get the position of the first character in this row
-            pos = app.current_position - app.current_column
-
-            # Loop over keys until we find a key containing the
-            # user input
-            for row in range(app.current_row, app.tree.height):
-                # Compute the position at this row
-                pos += len(app.tree.tree_text_split[row]) + 1
+            # Find the next key containing the user input
+            row = app.tree.find_key(key, app.current_row + 1)
 
-                # Ensure we don't over shoot
-                if row + 1 > app.tree.height - 1:
-                    app.print("Couldn't find matching key!")
-                    app.default_focus()
-                    app.return_to_normal_mode()
-                    return
-
-                # If we are at the next node stop
-                if key in app.tree.get_current_node(row + 1).name:
-                    break
+            # Ensure we found something
+            if row is None:
+                app.print("Couldn't find matching key!")
+                app.default_focus()
+                app.return_to_normal_mode()
+                return
 
             # Return to normal
             app.default_focus()
             app.return_to_normal_mode()
 
-            # Move the cursor
-            app.set_cursor_position(app.tree.tree_text, pos)
+            # Move the cursor to the first character in the matching row
+            app.set_cursor_position(
+                app.tree.tree_text, app.tree.row_offset(row)
+            )
 
         # Get the indices from the user
         app.input(
@@ -154,15 +141,11 @@ def _init_jump_bindings(app):
         )
 
     # Bind the functions
-    app.kb.add("t", filter=Condition(lambda: app.flag_jump_mode))(jump_to_top)
-    app.kb.add("b", filter=Condition(lambda: app.flag_jump_mode))(
-        jump_to_bottom
-    )
-    app.kb.add("p", filter=Condition(lambda: app.flag_jump_mode))(
-        jump_to_parent
-    )
-    app.kb.add("n", filter=Condition(lambda: app.flag_jump_mode))(jump_to_next)
-    app.kb.add("k", filter=Condition(lambda: app.flag_jump_mode))(jump_to_key)
+    app.kb.add("t", filter=app.filter_jump_mode)(jump_to_top)
+    app.kb.add("b", filter=app.filter_jump_mode)(jump_to_bottom)
+    app.kb.add("p", filter=app.filter_jump_mode)(jump_to_parent)
+    app.kb.add("n", filter=app.filter_jump_mode)(jump_to_next)
+    app.kb.add("k", filter=app.filter_jump_mode)(jump_to_key)
 
     # Add the hot keys
     hot_keys = VSplit(
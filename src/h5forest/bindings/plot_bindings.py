@@ -140,19 +140,15 @@ def _init_plot_bindings(app):
         app.shift_focus(app.tree_content)
 
     # Bind the functions
-    app.kb.add("x", filter=Condition(lambda: app.flag_plotting_mode))(select_x)
-    app.kb.add("y", filter=Condition(lambda: app.flag_plotting_mode))(select_y)
+    app.kb.add("x", filter=app.filter_plotting_mode)(select_x)
+    app.kb.add("y", filter=app.filter_plotting_mode)(select_y)
     app.kb.add(
         "enter",
         filter=Condition(lambda: app.app.layout.has_focus(app.plot_content)),
     )(edit_plot_entry)
-    app.kb.add("p", filter=Condition(lambda: app.flag_plotting_mode))(
-        plot_scatter
-    )
-    app.kb.add("P", filter=Condition(lambda: app.flag_plotting_mode))(
-        save_scatter
-    )
-    app.kb.add("r", filter=Condition(lambda: app.flag_plotting_mode))(reset)
+    app.kb.add("p", filter=app.filter_plotting_mode)(plot_scatter)
+    app.kb.add("P", filter=app.filter_plotting_mode)(save_scatter)
+    app.kb.add("r", filter=app.filter_plotting_mode)(reset)
     app.kb.add(
         "e",
         filter=Condition(
@@ -5,8 +5,6 @@ in this module should not be called directly, but are intended to be used by
 the application.
 """
 
-from prompt_toolkit.document import Document
-from prompt_toolkit.filters import Condition
 from prompt_toolkit.layout import ConditionalContainer
 from prompt_toolkit.widgets import Label
 
@@ -23,12 +21,30 @@ def _init_tree_bindings(app):
     @error_handler
     def move_up_ten(event):
         """Move up ten lines."""
-        app.tree_buffer.cursor_up(10)
+        # Find the row ten lines up (clamped to the top)
+        row = max(0, app.current_row - 10)
+
+        # Keep the cursor in the same column (or the end of a shorter row)
+        pos = app.tree.row_offset(row) + min(
+            app.current_column, app.tree.row_length(row)
+        )
+
+        # Move the cursor
+        app.set_cursor_position(app.tree.tree_text, pos)
 
     @error_handler
     def move_down_ten(event):
         """Move down ten lines."""
-        app.tree_buffer.cursor_down(10)
+        # Find the row ten lines down (clamped to the bottom)
+        row = min(app.current_row + 10, app.tree.height - 1)
+
+        # Keep the cursor in the same column (or the end of a shorter row)
+        pos = app.tree.row_offset(row) + min(
+            app.current_column, app.tree.row_length(row)
+        )
+
+        # Move the cursor
+        app.set_cursor_position(app.tree.tree_text, pos)
 
     @error_handler
     def expand_collapse_node(event):
@@ -57,49 +73,37 @@ def _init_tree_bindings(app):
 
         # If the node is already open, close it
         if node.is_expanded:
-            app.tree_buffer.set_document(
-                Document(
-                    app.tree.close_node(node, current_row),
-                    cursor_position=current_pos,
-                ),
-                bypass_readonly=True,
+            app.set_cursor_position(
+                app.tree.close_node(node, current_row), current_pos
             )
         else:  # Otherwise, open it
-            app.tree_buffer.set_document(
-                Document(
-                    app.tree.update_tree_text(node, current_row),
-                    cursor_position=current_pos,
-                ),
-                bypass_readonly=True,
+            app.set_cursor_position(
+                app.tree.update_tree_text(node, current_row), current_pos
             )
 
     # Bind the functions
     app.kb.add(
         "{",
-        filter=Condition(lambda: app.app.layout.has_focus(app.tree_content)),
+        filter=app.filter_tree_focus,
     )(move_up_ten)
     app.kb.add(
         "}",
-        filter=Condition(lambda: app.app.layout.has_focus(app.tree_content)),
+        filter=app.filter_tree_focus,
     )(move_down_ten)
     app.kb.add(
         "enter",
-        filter=Condition(lambda: app.app.layout.has_focus(app.tree_content)),
+        filter=app.filter_tree_focus,
     )(expand_collapse_node)
 
     # Add hot keys
     hot_keys = [
         ConditionalContainer(
             Label("Enter → Open Group"),
-            filter=Condition(
-                lambda: app.app.layout.has_focus(app.tree_content)
-            ),
+            filter=app.filter_tree_focus,
         ),
         ConditionalContainer(
             Label("{/} → Move Up/Down 10 Lines"),
-            filter=Condition(
-                lambda: app.app.layout.has_focus(app.tree_content)
-            ),
+            filter=app.filter_tree_focus,
         ),
     ]
 
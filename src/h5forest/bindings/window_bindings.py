@@ -66,16 +66,14 @@ def _init_window_bindings(app):
         app.return_to_normal_mode()
 
     # Bind the functions
-    app.kb.add("t", filter=Condition(lambda: app.flag_window_mode))(move_tree)
-    app.kb.add("a", filter=Condition(lambda: app.flag_window_mode))(move_attr)
+    app.kb.add("t", filter=app.filter_window_mode)(move_tree)
+    app.kb.add("a", filter=app.filter_window_mode)(move_attr)
     app.kb.add(
         "v",
-        filter=Condition(
-            lambda: app.flag_window_mode and app.flag_values_visible
-        ),
+        filter=app.filter_window_mode & app.filter_values_visible,
     )(move_values)
-    app.kb.add("p", filter=Condition(lambda: app.flag_window_mode))(move_plot)
-    app.kb.add("h", filter=Condition(lambda: app.flag_window_mode))(move_hist)
+    app.kb.add("p", filter=app.filter_window_mode)(move_plot)
+    app.kb.add("h", filter=app.filter_window_mode)(move_hist)
     app.kb.add("escape")(move_to_default)
 
     # Add the hot keys
@@ -21,8 +21,8 @@ def error_handler(func):
             raise
         except Exception as e:
             # Nested import to avoid circular dependencies
-            from h5forest.h5_forest import H5Forest
+            from h5forest.h5_forest import get_forest
 
-            H5Forest().print(f"ERROR@{func.__name__}: {e}")
+            get_forest().print(f"ERROR@{func.__name__}: {e}")
 
     return wrapper
@@ -8,10 +8,12 @@ Example Usage:
 
 """
 
+import asyncio
+import os
 import sys
+import threading
 
 from prompt_toolkit import Application
-from prompt_toolkit.application import get_app
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.document import Document
 from prompt_toolkit.filters import Condition
@@ -37,15 +39,15 @@ from h5forest.bindings import (
 from h5forest.plotting import HistogramPlotter, ScatterPlotter
 from h5forest.styles import style
 from h5forest.tree import Tree, TreeProcessor
-from h5forest.utils import DynamicTitle, get_window_size
+from h5forest.utils import DynamicTitle, FlagFilter, get_window_size
 
 
 class H5Forest:
     """
     The main application for the HDF5 Forest.
 
-    This class is a singleton. Any attempt to create a new instance will
-    return the existing instance. This makes the instance available globally.
+    Only a single instance of this class should exist. This is created and
+    made available globally by get_forest.
 
     Attributes:
         tree (Tree):
@@ -61,6 +63,26 @@ class H5Forest:
             A flag to control the dataset mode of the application.
         _flag_window_mode (bool):
             A flag to control the window mode of the application.
+        filter_normal_mode (FlagFilter):
+            The filter for normal mode shared by the keybindings and layout.
+        filter_jump_mode (FlagFilter):
+            The filter for jump mode shared by the keybindings and layout.
+        filter_dataset_mode (FlagFilter):
+            The filter for dataset mode shared by the keybindings and layout.
+        filter_window_mode (FlagFilter):
+            The filter for window mode shared by the keybindings and layout.
+        filter_plotting_mode (FlagFilter):
+            The filter for plotting mode shared by the keybindings and layout.
+        filter_hist_mode (FlagFilter):
+            The filter for hist mode shared by the keybindings and layout.
+        filter_values_visible (FlagFilter):
+            The filter for whether the values text area is visible.
+        filter_expanded_attrs (FlagFilter):
+            The filter for whether the attributes are expanded.
+        filter_progress_bar (FlagFilter):
+            The filter for whether the progress bar is visible.
+        filter_tree_focus (Condition):
+            The filter for whether the tree has focus.
         jump_keys (VSplit):
             The hotkeys for the jump mode.
         dataset_keys (VSplit):
@@ -88,6 +110,19 @@ class H5Forest:
         prev_row (int):
             The previous row the cursor was on. This means we can avoid
             updating the metadata and attributes when the cursor hasn't moved.
+        _pending_row (int):
+            The row the cursor most recently moved to. Used to debounce
+            the metadata and attribute updates while the cursor is moving.
+        _mini_focused (bool):
+            Whether the mini buffer has focus. This is updated whenever we
+            shift focus and before each render.
+        _invalidate_scheduled (bool):
+            Whether a redraw of the application has already been scheduled.
+        _stop_event (threading.Event):
+            Set when the application exits to tell background workers to
+            stop at their next opportunity.
+        _workers (list):
+            The background worker threads still running.
         tree_frame (Frame):
             The frame for the tree text area.
         metadata_frame (Frame):
@@ -106,24 +141,74 @@ class H5Forest:
             The main application object.
     """
 
-    # Singleton instance
-    _instance = None
-
-    def __new__(cls, *args, **kwargs):
-        """
-        Create a new instance of the class.
-
-        This method ensures that only one instance of the class is created.
-
-        This method takes precendence over the usual __init__ method.
-        """
-        if cls._instance is None:
-            cls._instance = super(H5Forest, cls).__new__(cls)
-            # Call the init method explicitly to initialize the instance
-            cls._instance._init(*args, **kwargs)
-        return cls._instance
-
-    def _init(self, hdf5_filepath):
+    # Declare every attribute up front. This is accessed on every key press
+    # and render so fixed slots are cheaper than an instance dictionary
+    __slots__ = (
+        "tree",
+        "tree_processor",
+        "flag_values_visible",
+        "flag_progress_bar",
+        "flag_expanded_attrs",
+        "_flag_normal_mode",
+        "_flag_jump_mode",
+        "_flag_dataset_mode",
+        "_flag_window_mode",
+        "_flag_plotting_mode",
+        "_flag_hist_mode",
+        "_mini_focused",
+        "filter_normal_mode",
+        "filter_jump_mode",
+        "filter_dataset_mode",
+        "filter_window_mode",
+        "filter_plotting_mode",
+        "filter_hist_mode",
+        "filter_values_visible",
+        "filter_expanded_attrs",
+        "filter_progress_bar",
+        "filter_tree_focus",
+        "kb",
+        "hot_keys",
+        "dataset_keys",
+        "jump_keys",
+        "window_keys",
+        "plot_keys",
+        "hist_keys",
+        "value_title",
+        "scatter_plotter",
+        "histogram_plotter",
+        "tree_buffer",
+        "tree_content",
+        "metadata_content",
+        "attributes_content",
+        "values_content",
+        "mini_buffer_content",
+        "progress_bar_content",
+        "plot_content",
+        "hist_content",
+        "prev_row",
+        "_pending_row",
+        "_invalidate_scheduled",
+        "_stop_event",
+        "_workers",
+        "tree_frame",
+        "metadata_frame",
+        "attrs_frame",
+        "values_frame",
+        "plot_frame",
+        "hist_frame",
+        "hotkeys_panel",
+        "layout",
+        "user_input",
+        "app",
+        "input_buffer_content",
+        "expanded_attrs_frame",
+        "mini_buffer",
+        "input_buffer",
+        "hotkeys_frame",
+        "progress_frame",
+    )
+
+    def __init__(self, hdf5_filepath):
         """
         Initialise the application.
 
@@ -157,6 +242,23 @@ class H5Forest:
         self._flag_plotting_mode = False
         self._flag_hist_mode = False
 
+        # Track whether the mini buffer has focus (i.e. we are awaiting user
+        # input) so the mode flags don't need to query the layout
+        self._mini_focused = False
+
+        # Set up the filters shared by the keybindings and layout
+        self.filter_normal_mode = None
+        self.filter_jump_mode = None
+        self.filter_dataset_mode = None
+        self.filter_window_mode = None
+        self.filter_plotting_mode = None
+        self.filter_hist_mode = None
+        self.filter_values_visible = None
+        self.filter_expanded_attrs = None
+        self.filter_progress_bar = None
+        self.filter_tree_focus = None
+        self._init_filters()
+
         # Set up the main app and tree bindings. The hot keys for these are
         # combined into a single hot keys panel which will be shown whenever
         # in normal mode
@@ -194,6 +296,16 @@ class H5Forest:
         # We need to hang on to some information to avoid over the
         # top computations running in the background for threaded functions
         self.prev_row = None
+        self._pending_row = None
+
+        # Flag for whether a redraw is already scheduled (allowing us to
+        # batch up redraws)
+        self._invalidate_scheduled = False
+
+        # Background workers (e.g. computing dataset statistics) and the
+        # event used to ask them to stop when we exit
+        self._stop_event = threading.Event()
+        self._workers = []
 
         # Set up the layout
         self.tree_frame = None
@@ -214,13 +326,52 @@ class H5Forest:
             layout=self.layout,
             key_bindings=self.kb,
             full_screen=True,
-            mouse_support=True,
+            # Mouse support can be turned off (H5FOREST_MOUSE=0) to stop
+            # the terminal sending us every mouse event
+            mouse_support=os.environ.get("H5FOREST_MOUSE", "1") != "0",
             style=style,
+            before_render=lambda _: self._update_mini_focused(),
         )
 
     def run(self):
         """Run the application."""
-        self.app.run()
+        try:
+            self.app.run()
+        finally:
+            # Ask any background workers to stop and wait for them, we must
+            # not close the file while they are part way through reading it
+            # (even if the application fell over)
+            self._stop_event.set()
+            for worker in self._workers:
+                worker.join()
+
+            # Now we're done we can close the file
+            self.tree.close()
+
+    def start_worker(self, target):
+        """
+        Run a function in a background worker thread.
+
+        The worker is tracked so it can be stopped and joined before the
+        file is closed when the application exits. Workers should check
+        the stop event passed to them and return early once it is set.
+
+        Args:
+            target (callable):
+                The function to run. It is called with the stop event.
+
+        Returns:
+            threading.Thread:
+                The started worker thread.
+        """
+        # Forget about any workers that have already finished
+        self._workers = [w for w in self._workers if w.is_alive()]
+
+        worker = threading.Thread(target=target, args=(self._stop_event,))
+        self._workers.append(worker)
+        worker.start()
+
+        return worker
 
     @property
     def current_row(self):
@@ -234,10 +385,13 @@ class H5Forest:
         # Get the tree content
         doc = self.tree_buffer.document
 
-        # Get the current cursor row
-        current_row = doc.cursor_position_row
+        # If the buffer is showing the current tree text we can look the row
+        # up from the tree's cached row offsets, otherwise fall back on the
+        # document (e.g. mid way through expanding/collapsing a node)
+        if doc.text is self.tree.tree_text:
+            return self.tree.row_for_position(doc.cursor_position)
 
-        return current_row
+        return doc.cursor_position_row
 
     @property
     def current_column(self):
@@ -279,9 +433,7 @@ class H5Forest:
             bool:
                 The flag for normal mode.
         """
-        return self._flag_normal_mode and not self.app.layout.has_focus(
-            self.mini_buffer_content
-        )
+        return self._flag_normal_mode and not self._mini_focused
 
     @property
     def flag_jump_mode(self):
@@ -295,9 +447,7 @@ class H5Forest:
             bool:
                 The flag for jump mode.
         """
-        return self._flag_jump_mode and not self.app.layout.has_focus(
-            self.mini_buffer_content
-        )
+        return self._flag_jump_mode and not self._mini_focused
 
     @property
     def flag_dataset_mode(self):
@@ -311,9 +461,7 @@ class H5Forest:
             bool:
                 The flag for dataset mode.
         """
-        return self._flag_dataset_mode and not self.app.layout.has_focus(
-            self.mini_buffer_content
-        )
+        return self._flag_dataset_mode and not self._mini_focused
 
     @property
     def flag_window_mode(self):
@@ -327,9 +475,7 @@ class H5Forest:
             bool:
                 The flag for window mode.
         """
-        return self._flag_window_mode and not self.app.layout.has_focus(
-            self.mini_buffer_content
-        )
+        return self._flag_window_mode and not self._mini_focused
 
     @property
     def flag_plotting_mode(self):
@@ -343,9 +489,7 @@ class H5Forest:
             bool:
                 The flag for plotting mode.
         """
-        return self._flag_plotting_mode and not self.app.layout.has_focus(
-            self.mini_buffer_content
-        )
+        return self._flag_plotting_mode and not self._mini_focused
 
     @property
     def flag_hist_mode(self):
@@ -359,9 +503,7 @@ class H5Forest:
             bool:
                 The flag for histogram mode.
         """
-        return self._flag_hist_mode and not self.app.layout.has_focus(
-            self.mini_buffer_content
-        )
+        return self._flag_hist_mode and not self._mini_focused
 
     def return_to_normal_mode(self):
         """Return to normal mode."""
@@ -372,6 +514,27 @@ class H5Forest:
         self._flag_plotting_mode = False
         self._flag_hist_mode = False
 
+    def _init_filters(self):
+        """
+        Initialise the filters shared by the keybindings and layout.
+
+        Each of these is created once and reused everywhere it's needed
+        rather than creating a new Condition for every keybinding and
+        container. Those that just read a flag are FlagFilters.
+        """
+        self.filter_normal_mode = FlagFilter(self, "flag_normal_mode")
+        self.filter_jump_mode = FlagFilter(self, "flag_jump_mode")
+        self.filter_dataset_mode = FlagFilter(self, "flag_dataset_mode")
+        self.filter_window_mode = FlagFilter(self, "flag_window_mode")
+        self.filter_plotting_mode = FlagFilter(self, "flag_plotting_mode")
+        self.filter_hist_mode = FlagFilter(self, "flag_hist_mode")
+        self.filter_values_visible = FlagFilter(self, "flag_values_visible")
+        self.filter_expanded_attrs = FlagFilter(self, "flag_expanded_attrs")
+        self.filter_progress_bar = FlagFilter(self, "flag_progress_bar")
+        self.filter_tree_focus = Condition(
+            lambda: self.app.layout.has_focus(self.tree_content)
+        )
+
     def _init_text_areas(self):
         """Initialise the content for each frame."""
         # Buffer for the tree content itself
@@ -469,10 +632,15 @@ class H5Forest:
         """
         Set the cursor position in the tree.
 
-        This is a horrid workaround but seems to be the only way to do it
-        in prompt_toolkit. We reset the entire Document with the
-        tree content text and a new cursor position.
+        If the text is unchanged we can just move the cursor on the
+        existing buffer. Otherwise we have to reset the entire Document with
+        the tree content text and a new cursor position.
         """
+        # If the text hasn't changed just move the cursor
+        if self.tree_buffer.document.text is text:
+            self.tree_buffer.cursor_position = new_cursor_pos
+            return
+
         # Create a new tree_content document with the updated cursor
         # position
         self.tree_buffer.set_document(
@@ -484,25 +652,114 @@ class H5Forest:
         """
         Apply changes when the cursor has been moved.
 
+        Rather than updating immediately we schedule a debounced update on
+        the application's event loop. This means a burst of cursor movements
+        (e.g. holding down an arrow key) only results in a single update
+        once the cursor comes to rest.
+        """
+        # Record where the cursor is now
+        self._pending_row = self.current_row
+
+        # Move the highlighting to the node under the cursor straight away so
+        # it's included in the render following this movement
+        if self._pending_row < self.tree.height:
+            self.tree.get_current_node(self._pending_row)
+
+        # Schedule the update
+        self.app.create_background_task(
+            self._debounced_cursor_update(self._pending_row)
+        )
+
+    async def _debounced_cursor_update(self, row):
+        """
+        Update the metadata and attributes if the cursor has come to rest.
+
         This will update the metadata and attribute outputs to display
         what is currently under the cursor.
+
+        Note that this runs as a task on the application's event loop
+        rather than in a separate thread, so any HDF5 access triggered by
+        cursor movement happens on the same thread as the UI. The only
+        other threads touching the file are those computing dataset
+        statistics and plots, which rely on h5py's global lock to
+        serialise access to the shared file handle.
+
+        Args:
+            row (int):
+                The row the cursor was on when the update was scheduled.
         """
+        # Wait to see if the cursor moves again
+        await asyncio.sleep(0.03)
+
+        # If the cursor has moved on since this update was scheduled a newer
+        # update will handle it
+        if row != self._pending_row:
+            return
+
+        # If the cursor has come to rest on the row we last updated for
+        # (e.g. it only moved within the row) there's nothing to do
+        if row == self.prev_row:
+            return
+
+        # Flag for whether anything has changed and we need to redraw
+        dirty = False
+
         # Get the current node
         try:
-            node = self.tree.get_current_node(self.current_row)
-            self.metadata_content.text = node.get_meta_text()
-            self.attributes_content.text = node.get_attr_text()
+            node = self.tree.get_current_node(row)
+
+            # Only update the text (and redraw) if it has actually changed,
+            # neighbouring nodes often share the same metadata/attributes
+            meta_text = node.get_meta_text()
+            if meta_text != self.metadata_content.text:
+                self.metadata_content.text = meta_text
+                dirty = True
+            attr_text = node.get_attr_text()
+            if attr_text != self.attributes_content.text:
+                self.attributes_content.text = attr_text
+                dirty = True
+            self.prev_row = row
 
         except IndexError:
             self.set_cursor_position(
                 self.tree.tree_text,
-                new_cursor_pos=self.tree.length
-                - len(self.tree.tree_text_split[self.tree.height - 1]),
+                new_cursor_pos=self.tree.length - self.tree._last_line_len,
             )
             self.metadata_content.text = ""
             self.attributes_content.text = ""
+            self.prev_row = None
+            dirty = True
+
+        if dirty:
+            self.schedule_invalidate()
+
+    def schedule_invalidate(self):
+        """
+        Schedule a redraw of the application.
 
-        get_app().invalidate()
+        Rather than redrawing for every update we batch updates together,
+        redrawing at most once per frame (~60 Hz). This is safe to call from
+        any thread.
+        """
+        # Nothing to do if a redraw is already on its way
+        if self._invalidate_scheduled:
+            return
+
+        # If the app isn't running yet there's no loop to schedule on, the
+        # first render will pick up any changes
+        loop = self.app.loop
+        if loop is None:
+            return
+
+        self._invalidate_scheduled = True
+        loop.call_soon_threadsafe(
+            loop.call_later, 0.016, self._flush_invalidate
+        )
+
+    def _flush_invalidate(self):
+        """Redraw the application and allow the next redraw to be scheduled."""
+        self._invalidate_scheduled = False
+        self.app.invalidate()
 
     def _init_layout(self):
         """Intialise the layout."""
@@ -547,7 +804,7 @@ class H5Forest:
                 height=10,
                 width=columns // 2,
             ),
-            filter=Condition(lambda: not self.flag_expanded_attrs),
+            filter=~self.filter_expanded_attrs,
         )
         self.expanded_attrs_frame = ConditionalContainer(
             Frame(
@@ -555,7 +812,7 @@ class H5Forest:
                 title="Attributes",
                 width=columns // 2,
             ),
-            filter=Condition(lambda: self.flag_expanded_attrs),
+            filter=self.filter_expanded_attrs,
         )
 
         # Set up the values frame (this is where we'll display the values of
@@ -583,7 +840,7 @@ class H5Forest:
         # Wrap those frames that need it in conditional containers
         self.values_frame = ConditionalContainer(
             content=self.values_frame,
-            filter=Condition(lambda: self.flag_values_visible),
+            filter=self.filter_values_visible,
         )
 
         # Set up the hotkeys panel
@@ -591,40 +848,38 @@ class H5Forest:
             [
                 ConditionalContainer(
                     content=self.hot_keys,
-                    filter=Condition(lambda: self.flag_normal_mode),
+                    filter=self.filter_normal_mode,
                 ),
                 ConditionalContainer(
                     content=self.jump_keys,
-                    filter=Condition(lambda: self.flag_jump_mode),
+                    filter=self.filter_jump_mode,
                 ),
                 ConditionalContainer(
                     content=self.dataset_keys,
-                    filter=Condition(lambda: self.flag_dataset_mode),
+                    filter=self.filter_dataset_mode,
                 ),
                 ConditionalContainer(
                     content=self.window_keys,
-                    filter=Condition(lambda: self.flag_window_mode),
+                    filter=self.filter_window_mode,
                 ),
                 ConditionalContainer(
                     content=self.plot_keys,
-                    filter=Condition(lambda: self.flag_plotting_mode),
+                    filter=self.filter_plotting_mode,
                 ),
                 ConditionalContainer(
                     content=self.hist_keys,
-                    filter=Condition(lambda: self.flag_hist_mode),
+                    filter=self.filter_hist_mode,
                 ),
             ]
         )
         self.hotkeys_frame = ConditionalContainer(
             Frame(self.hotkeys_panel, height=3),
-            filter=Condition(
-                lambda: self.flag_normal_mode
-                or self.flag_jump_mode
-                or self.flag_dataset_mode
-                or self.flag_window_mode
-                or self.flag_plotting_mode
-                or self.flag_hist_mode
-            ),
+            filter=self.filter_normal_mode
+            | self.filter_jump_mode
+            | self.filter_dataset_mode
+            | self.filter_window_mode
+            | self.filter_plotting_mode
+            | self.filter_hist_mode,
         )
 
         # Set up the plot frame
@@ -653,7 +908,7 @@ class H5Forest:
         # Set up the progress bar and buffer conditional containers
         self.progress_frame = ConditionalContainer(
             Frame(self.progress_bar_content, height=3),
-            filter=Condition(lambda: self.flag_progress_bar),
+            filter=self.filter_progress_bar,
         )
         buffers = HSplit([self.input_buffer, self.mini_buffer])
 
@@ -692,7 +947,7 @@ class H5Forest:
         """Print a single line to the mini buffer."""
         args = [str(a) for a in args]
         self.mini_buffer_content.text = " ".join(args)
-        self.app.invalidate()
+        self.schedule_invalidate()
 
     def input(self, prompt, callback, mini_buffer_text=""):
         """
@@ -721,13 +976,20 @@ class H5Forest:
         self.mini_buffer_content.document = Document(
             mini_buffer_text, cursor_position=len(mini_buffer_text)
         )
-        self.app.invalidate()
 
         # Shift focus to the mini buffer to await input
         self.shift_focus(self.mini_buffer_content)
 
+        def remove_bindings():
+            """Remove the temporary keybindings for this input action."""
+            self.kb.remove(on_enter)
+            self.kb.remove(on_esc)
+
         def on_enter(event):
             """Take the users input and process it."""
+            # We're done with this input so remove its keybindings
+            remove_bindings()
+
             # Read the text from the mini_buffer_content TextArea
             self.user_input = self.mini_buffer_content.text
 
@@ -739,12 +1001,16 @@ class H5Forest:
 
         def on_esc(event):
             """Return to normal mode."""
+            # We're done with this input so remove its keybindings
+            remove_bindings()
+
             # Clear buffers_content TextArea after processing
             self.input_buffer_content.text = ""
             self.return_to_normal_mode()
             self.shift_focus(current_focus)
 
-        # Add a temporary keybinding for Enter specific to this input action
+        # Add temporary keybindings for Enter and Escape specific to this
+        # input action (these are removed once either is pressed)
         self.kb.add(
             "enter",
             filter=Condition(
@@ -758,12 +1024,19 @@ class H5Forest:
             ),
         )(on_esc)
 
-        # Update the app
-        get_app().invalidate()
+        # Redraw once now everything is set up
+        self.schedule_invalidate()
+
+    def _update_mini_focused(self):
+        """Update the cached flag for whether the mini buffer has focus."""
+        self._mini_focused = self.app.layout.has_focus(
+            self.mini_buffer_content
+        )
 
     def default_focus(self):
         """Shift the focus to the tree."""
         self.app.layout.focus(self.tree_content)
+        self._update_mini_focused()
 
     def shift_focus(self, focused_area):
         """
@@ -774,15 +1047,41 @@ class H5Forest:
                 The text area to focus on.
         """
         self.app.layout.focus(focused_area)
+        self._update_mini_focused()
 
     def _create_mouse_handler(self, content_area):
         def mouse_handler(mouse_event):
             if mouse_event.event_type == MouseEventType.MOUSE_UP:
-                get_app().layout.focus(content_area)
+                self.shift_focus(content_area)
 
         return mouse_handler
 
 
+# The application instance (see get_forest)
+_forest = None
+
+
+def get_forest(hdf5_filepath=None):
+    """
+    Return the application instance, creating it if necessary.
+
+    The first call must provide the path to the HDF5 file to be explored.
+    Any subsequent calls will return the existing instance.
+
+    Args:
+        hdf5_filepath (str, optional):
+            The path to the HDF5 file to be explored.
+
+    Returns:
+        H5Forest:
+            The application instance.
+    """
+    global _forest
+    if _forest is None:
+        _forest = H5Forest(hdf5_filepath)
+    return _forest
+
+
 def main():
     """Intialise and run the application."""
     # First port of call, check we have been given a valid input
@@ -794,7 +1093,7 @@ def main():
     filepath = sys.argv[1]
 
     # Set up the app
-    app = H5Forest(filepath)
+    app = get_forest(filepath)
 
     # Lets get going!
     app.run()
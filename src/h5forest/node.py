@@ -81,6 +81,8 @@ class Node:
             The attribute text for the node.
         _meta_text (str):
             The metadata text for the node.
+        _h5obj (h5py.Group/h5py.Dataset):
+            The open HDF5 object the node represents.
     """
 
     def __init__(self, name, obj, filepath, parent=None):
@@ -128,6 +130,10 @@ class Node:
         # Store the type of the obj
         self.obj_type = type(obj)
 
+        # Hold on to the open HDF5 object so we never need to resolve the
+        # path from the file again
+        self._h5obj = obj
+
         # Store whether the node is a group or dataset
         if isinstance(obj, h5py.Group):
             self.is_group = True
@@ -136,18 +142,23 @@ class Node:
             self.is_group = False
             self.is_dataset = True
 
-        # Does this node have children?
+        # Does this node have children? (We only need the size of the
+        # group here, the children themselves are only loaded when the node
+        # is opened)
         if self.is_group:
-            self.nr_child = len(obj.keys())
+            self.nr_child = len(obj)
             self.has_children = bool(self.nr_child > 0)
         else:
             self.nr_child = 0
             self.has_children = False
 
-        # Does this node have attributes?
-        self.nr_attrs = len(obj.attrs.keys())
+        # Read the attributes (h5py still opens each one by name)
+        self.attrs = dict(obj.attrs.items())
+
+        # Does this node have attributes? (counted from what we just read
+        # rather than listing the keys again)
+        self.nr_attrs = len(self.attrs)
         self.has_attrs = bool(self.nr_attrs > 0)
-        self.attrs = {key: obj.attrs[key] for key in obj.attrs.keys()}
 
         # For a dataset we can get a bunch of metadata to display
         if self.is_dataset:
@@ -193,6 +204,20 @@ class Node:
         if self.depth == 0:
             self.open_node()
 
+    @property
+    def h5obj(self):
+        """
+        Return the open HDF5 object the node represents.
+
+        This is the handle held for the lifetime of the tree, use it to read
+        from the Group/Dataset rather than looking the path up in the file.
+
+        Returns:
+            h5py.Group/h5py.Dataset:
+                The open HDF5 object.
+        """
+        return self._h5obj
+
     @property
     def is_expanded(self):
         """
@@ -245,13 +270,14 @@ class Node:
         if self.is_dataset:
             raise ValueError("Cannot open a dataset as a group.")
 
-        with h5py.File(self.filepath, "r") as hdf:
-            if self.nr_child > 0:
-                for key in hdf[self.path].keys():
-                    child = hdf[f"{self.path}/{key}"]
-                    self.children.append(
-                        Node(key, child, self.filepath, parent=self)
-                    )
+        # Look each child up relative to this group's open handle (h5py
+        # still opens them one by one by name) rather than resolving the
+        # full path from the root of the file
+        if self.nr_child > 0:
+            for key, child in self._h5obj.items():
+                self.children.append(
+                    Node(key, child, self.filepath, parent=self)
+                )
 
     def close_node(self):
         """Close the node of the HDF5 file."""
@@ -353,11 +379,12 @@ class Node:
         When no range is specified this method will try to limit to a sensible
         output size if necessary. If the Dataset is small enough we can
         just read everything and display it. If the dataset is too large
-        we will only show a truncated view (first 100 elements or what will
-        fit in the TextArea).
+        we will only read and show a truncated view (roughly the first 1000
+        elements spread across the dimensions).
 
-        When a range is stated that range of values will be read in and
-        displayed.
+        When a range is stated that range of values will be displayed. If the
+        range is too large to display in full only the rows either side of
+        the "..." are read from the file.
 
         Returns:
             str:
@@ -366,45 +393,91 @@ class Node:
         if self.is_group:
             return ""
         else:
-            with h5py.File(self.filepath, "r") as hdf:
-                dataset = hdf[self.path]
+            dataset = self._h5obj
 
-                # How many values roughly can we show maximally?
-                max_count = 1000
+            # How many values roughly can we show maximally?
+            max_count = 1000
 
-                # If a range has been given follow that
-                if start_index is not None:
-                    data_subset = dataset[start_index:end_index]
-                    truncated = (
-                        f"\n\nShowing {len(data_subset)}/"
-                        f"{dataset.size} elements ({start_index}-{end_index})."
-                    )
-
-                # If the dataset is small enough we can just read everything
-                elif dataset.size < max_count:
-                    data_subset = dataset[...]
-                    truncated = ""
+            # Beyond how many values do we summarise the text and how many
+            # items do we show at each end of a summarised axis?
+            threshold = 10000
+            edgeitems = 50
 
+            # If a range has been given follow that
+            if start_index is not None:
+                # Which rows (and how many elements) are in the range?
+                rows = range(
+                    *slice(start_index, end_index).indices(self.shape[0])
+                )
+                nrows = len(rows)
+                row_size = self.size // self.shape[0] if self.shape[0] else 0
+
+                # If the range is too large to show in full numpy will only
+                # display the first and last edgeitems rows, so only read
+                # those (with an extra row at each end so numpy still puts
+                # the "..." between them)
+                if nrows * row_size > threshold and nrows > 2 * edgeitems + 2:
+                    data_subset = np.concatenate(
+                        (
+                            dataset[rows.start : rows.start + edgeitems + 1],
+                            dataset[rows.stop - edgeitems - 1 : rows.stop],
+                        )
+                    )
+                    threshold = 0
                 else:
-                    # Divide the max count by the number of dimensions
-                    dim_count = max_count // dataset.ndim
+                    data_subset = dataset[start_index:end_index]
 
-                    # Work out how many elements we can read and display
-                    slices = []
-                    for dim in dataset.shape:
-                        slices.append(slice(0, dim_count))
+                truncated = (
+                    f"\n\nShowing {nrows}/"
+                    f"{self.size} elements ({start_index}-{end_index})."
+                )
 
-                    data_subset = dataset[tuple(slices)]
+            # If the dataset is small enough we can just read everything
+            elif self.size < max_count:
+                data_subset = dataset[...]
+                truncated = ""
 
-                    # Flag in the header we are only showing a truncated view
-                    truncated = (
-                        f"\n\nShowing {max_count}/{dataset.size} elements."
-                    )
+            else:
+                # Share the max count between the dimensions so the total
+                # number of elements we read is roughly max_count. Working
+                # from the shortest axis up, any axis shorter than its share
+                # (the nth root of what's left over the n remaining axes) is
+                # read in full and the rest is split between the longer axes
+                # (e.g. an (N, 3) dataset reads ~333 rows)
+                counts = [0] * self.ndim
+                remaining = max_count
+                order = np.argsort(self.shape)
+                for i, axis in enumerate(order):
+                    share = remaining ** (1 / (self.ndim - i))
+                    counts[axis] = min(self.shape[axis], int(np.ceil(share)))
+                    remaining /= counts[axis]
+
+                # Work out how many elements we can read and display
+                slices = []
+                for count in counts:
+                    slices.append(slice(0, count))
+
+                # Read only this corner of the dataset
+                data_subset = dataset[tuple(slices)]
+
+                # Flag in the header we are only showing a truncated view
+                truncated = (
+                    f"\n\nShowing {data_subset.size}/{self.size} elements."
+                )
 
-                # Combine path and data for output
-                return str(data_subset) + truncated
+            # Format the values with numpy in one go. We only summarise
+            # (with "...") beyond 10000 elements, anything smaller has been
+            # explicitly read to be shown in full
+            text = np.array2string(
+                np.asarray(data_subset),
+                threshold=threshold,
+                edgeitems=edgeitems,
+            )
 
-    def get_min_max(self):
+            # Combine path and data for output
+            return text + truncated
+
+    def get_min_max(self, stop_event=None):
         """
         Return the minimum and maximum values of the dataset.
 
@@ -414,6 +487,11 @@ class Node:
         and read in the data in manageable chunks and compute the
         minimum and maximum values on the fly.
 
+        Args:
+            stop_event (threading.Event):
+                An optional event which, once set, stops the calculation
+                between chunks (returning None, None).
+
         Returns:
             tuple:
                 The minimum and maximum values of the dataset.
@@ -421,49 +499,52 @@ class Node:
         if self.is_group:
             return None, None
         else:
-            with h5py.File(self.filepath, "r") as hdf:
-                dataset = hdf[self.path]
-
-                # If chunks and shape are equal just get the min and max
-                if not self.is_chunked:
-                    arr = dataset[:]
-                    return arr.min(), arr.max()
-
-                # OK, we have chunks, lets use them to avoid loading too
-                # much. behaviours
-                # based on dimensions
-
-                # For 1D arrays we can just loop getting the min and max.
-                # Define the initial min and max
-                min_val = np.inf
-                max_val = -np.inf
-
-                # Loop over all possible chunks
-                with ProgressBar(total=self.size, description="Min/Max") as pb:
-                    for chunk_index in np.ndindex(*self.n_chunks):
-                        # Get the current slice for each dimension
-                        slices = tuple(
-                            slice(
-                                c_idx * c_size,
-                                min((c_idx + 1) * c_size, s),
-                            )
-                            for c_idx, c_size, s in zip(
-                                chunk_index, self.chunks, self.shape
-                            )
+            dataset = self._h5obj
+
+            # If chunks and shape are equal just get the min and max
+            if not self.is_chunked:
+                arr = dataset[:]
+                return arr.min(), arr.max()
+
+            # OK, we have chunks, lets use them to avoid loading too
+            # much. behaviours
+            # based on dimensions
+
+            # For 1D arrays we can just loop getting the min and max.
+            # Define the initial min and max
+            min_val = np.inf
+            max_val = -np.inf
+
+            # Loop over all possible chunks
+            with ProgressBar(total=self.size, description="Min/Max") as pb:
+                for chunk_index in np.ndindex(*self.n_chunks):
+                    # Stop between chunks if we've been asked to
+                    if stop_event is not None and stop_event.is_set():
+                        return None, None
+
+                    # Get the current slice for each dimension
+                    slices = tuple(
+                        slice(
+                            c_idx * c_size,
+                            min((c_idx + 1) * c_size, s),
+                        )
+                        for c_idx, c_size, s in zip(
+                            chunk_index, self.chunks, self.shape
                         )
+                    )
 
-                        # Read the chunk data
-                        chunk_data = dataset[slices]
+                    # Read the chunk data
+                    chunk_data = dataset[slices]
 
-                        # Get the minimum and maximum
-                        min_val = np.min((min_val, np.min(chunk_data)))
-                        max_val = np.max((max_val, np.max(chunk_data)))
+                    # Get the minimum and maximum
+                    min_val = np.min((min_val, np.min(chunk_data)))
+                    max_val = np.max((max_val, np.max(chunk_data)))
 
-                        pb.advance(step=chunk_data.size)
+                    pb.advance(step=chunk_data.size)
 
-                return min_val, max_val
+            return min_val, max_val
 
-    def get_mean(self):
+    def get_mean(self, stop_event=None):
         """
         Return the mean of the dataset values.
 
@@ -473,6 +554,11 @@ class Node:
         and read in the data in manageable chunks and compute the mean value
         on the fly.
 
+        Args:
+            stop_event (threading.Event):
+                An optional event which, once set, stops the calculation
+                between chunks (returning None).
+
         Returns:
             float:
                 The mean of the dataset values.
@@ -480,49 +566,52 @@ class Node:
         if self.is_group:
             return None, None
         else:
-            with h5py.File(self.filepath, "r") as hdf:
-                dataset = hdf[self.path]
-
-                # If chunks and shape are equal just get the min and max
-                if not self.is_chunked:
-                    arr = dataset[:]
-                    return arr.mean()
-
-                # OK, we have chunks, lets use them to make sure we don't load
-                # too much into memory. Now we need to have slightly
-                # different behaviours based on dimensions
-
-                # Define initial sum
-                val_sum = 0
-
-                # Loop over all possible chunks
-                with ProgressBar(total=self.size, description="Mean") as pb:
-                    for chunk_index in np.ndindex(*self.n_chunks):
-                        # Get the current slice for each dimension
-                        slices = tuple(
-                            slice(
-                                c_idx * c_size,
-                                min((c_idx + 1) * c_size, s),
-                            )
-                            for c_idx, c_size, s in zip(
-                                chunk_index, self.chunks, self.shape
-                            )
+            dataset = self._h5obj
+
+            # If chunks and shape are equal just get the min and max
+            if not self.is_chunked:
+                arr = dataset[:]
+                return arr.mean()
+
+            # OK, we have chunks, lets use them to make sure we don't load
+            # too much into memory. Now we need to have slightly
+            # different behaviours based on dimensions
+
+            # Define initial sum
+            val_sum = 0
+
+            # Loop over all possible chunks
+            with ProgressBar(total=self.size, description="Mean") as pb:
+                for chunk_index in np.ndindex(*self.n_chunks):
+                    # Stop between chunks if we've been asked to
+                    if stop_event is not None and stop_event.is_set():
+                        return None
+
+                    # Get the current slice for each dimension
+                    slices = tuple(
+                        slice(
+                            c_idx * c_size,
+                            min((c_idx + 1) * c_size, s),
                         )
+                        for c_idx, c_size, s in zip(
+                            chunk_index, self.chunks, self.shape
+                        )
+                    )
 
-                        # Read the chunk data
-                        chunk_data = dataset[slices]
+                    # Read the chunk data
+                    chunk_data = dataset[slices]
 
-                        # Get the sum
-                        val_sum += np.sum(
-                            chunk_data,
-                        )
+                    # Get the sum
+                    val_sum += np.sum(
+                        chunk_data,
+                    )
 
-                        pb.advance(step=chunk_data.size)
+                    pb.advance(step=chunk_data.size)
 
-                # Return the mean
-                return val_sum / (self.size)
+            # Return the mean
+            return val_sum / (self.size)
 
-    def get_std(self):
+    def get_std(self, stop_event=None):
         """
         Return the standard deviation of the dataset values.
 
@@ -533,6 +622,11 @@ class Node:
         and read in the data in manageable chunks and compute the standard
         deviation on the fly.
 
+        Args:
+            stop_event (threading.Event):
+                An optional event which, once set, stops the calculation
+                between chunks (returning None).
+
         Returns:
             float:
                 The standard deviation of the dataset values.
@@ -540,45 +634,48 @@ class Node:
         if self.is_group:
             return None, None
         else:
-            with h5py.File(self.filepath, "r") as hdf:
-                dataset = hdf[self.path]
-
-                # If chunks and shape are equal just get the min and max
-                if not self.is_chunked:
-                    arr = dataset[:]
-                    return arr.std()
-
-                # OK, we have chunks, lets use them to make sure we don't load
-                # too much into memory.
-
-                # Define initial sum
-                val_sum = 0
-                spu_val_sum = 0
-
-                # Loop over all possible chunks
-                with ProgressBar(total=self.size, description="StDev") as pb:
-                    for chunk_index in np.ndindex(*self.n_chunks):
-                        # Get the current slice for each dimension
-                        slices = tuple(
-                            slice(
-                                c_idx * c_size,
-                                min((c_idx + 1) * c_size, s),
-                            )
-                            for c_idx, c_size, s in zip(
-                                chunk_index, self.chunks, self.shape
-                            )
+            dataset = self._h5obj
+
+            # If chunks and shape are equal just get the min and max
+            if not self.is_chunked:
+                arr = dataset[:]
+                return arr.std()
+
+            # OK, we have chunks, lets use them to make sure we don't load
+            # too much into memory.
+
+            # Define initial sum
+            val_sum = 0
+            spu_val_sum = 0
+
+            # Loop over all possible chunks
+            with ProgressBar(total=self.size, description="StDev") as pb:
+                for chunk_index in np.ndindex(*self.n_chunks):
+                    # Stop between chunks if we've been asked to
+                    if stop_event is not None and stop_event.is_set():
+                        return None
+
+                    # Get the current slice for each dimension
+                    slices = tuple(
+                        slice(
+                            c_idx * c_size,
+                            min((c_idx + 1) * c_size, s),
+                        )
+                        for c_idx, c_size, s in zip(
+                            chunk_index, self.chunks, self.shape
                         )
+                    )
 
-                        # Read the chunk data
-                        chunk_data = dataset[slices]
+                    # Read the chunk data
+                    chunk_data = dataset[slices]
 
-                        # Get the sum and sum of squares
-                        val_sum += np.sum(chunk_data)
-                        spu_val_sum += np.sum(chunk_data**2)
+                    # Get the sum and sum of squares
+                    val_sum += np.sum(chunk_data)
+                    spu_val_sum += np.sum(chunk_data**2)
 
-                        pb.advance(step=chunk_data.size)
+                    pb.advance(step=chunk_data.size)
 
-                # Return the standard deviation
-                return np.sqrt(
-                    (spu_val_sum / self.size) - (val_sum / self.size) ** 2
-                )
+            # Return the standard deviation
+            return np.sqrt(
+                (spu_val_sum / self.size) - (val_sum / self.size) ** 2
+            )
@@ -2,14 +2,15 @@
 
 This is only ever called from the h5forest module and is not intended to be
 used directly by the user.
+
+Note that matplotlib.pyplot is only imported when a plot is actually made,
+importing it is by far the most expensive part of starting the application.
 """
 
 import os
 import threading
 import warnings
 
-import h5py
-import matplotlib.pyplot as plt
 import numpy as np
 from prompt_toolkit.application import get_app
 
@@ -63,25 +64,28 @@ class Plotter:
     @error_handler
     def show(self):
         """Show the plot and reset everything."""
+        # Nested import to avoid paying for pyplot at startup
+        import matplotlib.pyplot as plt
+
         plt.show()
 
     @error_handler
     def save(self):
         """Save the plot and reset everything."""
-        from h5forest.h5_forest import H5Forest
+        from h5forest.h5_forest import get_forest
 
         def save_callback():
             """Get the filepath and save the plot."""
             # Strip the user input
-            out_path = H5Forest().user_input.strip()
+            out_path = get_forest().user_input.strip()
 
             self.fig.savefig(out_path, dpi=100, bbox_inches="tight")
 
-            H5Forest().print("Plot saved!")
-            H5Forest().default_focus()
-            H5Forest().return_to_normal_mode()
+            get_forest().print("Plot saved!")
+            get_forest().default_focus()
+            get_forest().return_to_normal_mode()
 
-        H5Forest().input(
+        get_forest().input(
             "Enter the filepath to save the plot: ",
             save_callback,
             mini_buffer_text=os.getcwd() + "/",
@@ -188,17 +192,17 @@ class ScatterPlotter(Plotter):
             node (h5forest.h5_forest.Node):
                 The node to use for the x-axis.
         """
-        from h5forest.h5_forest import H5Forest
+        from h5forest.h5_forest import get_forest
 
         # Check the node is 1D
         if node.ndim > 1:
-            H5Forest().print("Dataset must be 1D!")
+            get_forest().print("Dataset must be 1D!")
             return self.plot_text
 
         # If we have any datasets already check we have a compatible shape
         for key in self.plot_params:
             if node.shape != self.plot_params[key].shape:
-                H5Forest().print("Datasets must have the same shape!")
+                get_forest().print("Datasets must have the same shape!")
                 return self.plot_text
 
         # Set the plot parameter for the x-axis key
@@ -210,12 +214,11 @@ class ScatterPlotter(Plotter):
         split_text[2] = f"x-label:     {node.path}"
         self.plot_text = "\n".join(split_text)
 
-        def run_in_thread():
+        def run_in_thread(stop_event):
             # Get the minimum and maximum values for the x and y axes
-            self.x_min, self.x_max = node.get_min_max()
+            self.x_min, self.x_max = node.get_min_max(stop_event)
 
-        self.assignx_thread = threading.Thread(target=run_in_thread)
-        self.assignx_thread.start()
+        self.assignx_thread = get_forest().start_worker(run_in_thread)
 
         return self.plot_text
 
@@ -230,17 +233,17 @@ class ScatterPlotter(Plotter):
             node (h5forest.h5_forest.Node):
                 The node to use for the y-axis.
         """
-        from h5forest.h5_forest import H5Forest
+        from h5forest.h5_forest import get_forest
 
         # Check the node is 1D
         if node.ndim > 1:
-            H5Forest().print("Dataset must be 1D!")
+            get_forest().print("Dataset must be 1D!")
             return self.plot_text
 
         # If we have any datasets already check we have a compatible shape
         for key in self.plot_params:
             if node.shape != self.plot_params[key].shape:
-                H5Forest().print("Datasets must have the same shape!")
+                get_forest().print("Datasets must have the same shape!")
                 return self.plot_text
 
         # Set the plot parameter for the y-axis key
@@ -252,12 +255,11 @@ class ScatterPlotter(Plotter):
         split_text[3] = f"y-label:     {node.path}"
         self.plot_text = "\n".join(split_text)
 
-        def run_in_thread():
+        def run_in_thread(stop_event):
             # Get the minimum and maximum values for the x and y axes
-            self.y_min, self.y_max = node.get_min_max()
+            self.y_min, self.y_max = node.get_min_max(stop_event)
 
-        self.assigny_thread = threading.Thread(target=run_in_thread)
-        self.assigny_thread.start()
+        self.assigny_thread = get_forest().start_worker(run_in_thread)
 
         return self.plot_text
 
@@ -300,6 +302,9 @@ class ScatterPlotter(Plotter):
         y_scale = split_text[5].split(": ")[1].strip()
         marker = split_text[6].split(": ")[1].strip()
 
+        # Nested import to avoid paying for pyplot at startup
+        import matplotlib.pyplot as plt
+
         # Create the figure
         self.fig = plt.figure(figsize=(3.5, 3.5))
         self.ax = self.fig.add_subplot(111)
@@ -317,9 +322,8 @@ class ScatterPlotter(Plotter):
                 or x_node.chunks != y_node.chunks
             ):
                 # Get the data
-                with h5py.File(x_node.filepath, "r") as hdf:
-                    self.x_data = hdf[x_node.path][...]
-                    self.y_data = hdf[y_node.path][...]
+                self.x_data = x_node.h5obj[...]
+                self.y_data = y_node.h5obj[...]
 
                 # Plot the data
                 self.ax.scatter(
@@ -331,35 +335,34 @@ class ScatterPlotter(Plotter):
 
             else:
                 # Loop over chunks and plot each one
-                with h5py.File(x_node.filepath, "r") as hdf:
-                    with ProgressBar(
-                        total=x_node.size, description="Scatter"
-                    ) as pb:
-                        for chunk_index in np.ndindex(*x_node.chunks):
-                            # Get the current slice for each dimension
-                            slices = tuple(
-                                slice(
-                                    c_idx * c_size,
-                                    min((c_idx + 1) * c_size, s),
-                                )
-                                for c_idx, c_size, s in zip(
-                                    chunk_index, x_node.chunks, x_node.shape
-                                )
+                with ProgressBar(
+                    total=x_node.size, description="Scatter"
+                ) as pb:
+                    for chunk_index in np.ndindex(*x_node.chunks):
+                        # Get the current slice for each dimension
+                        slices = tuple(
+                            slice(
+                                c_idx * c_size,
+                                min((c_idx + 1) * c_size, s),
+                            )
+                            for c_idx, c_size, s in zip(
+                                chunk_index, x_node.chunks, x_node.shape
                             )
+                        )
 
-                            # Get the data
-                            x_data = hdf[x_node.path][slices]
-                            y_data = hdf[y_node.path][slices]
+                        # Get the data
+                        x_data = x_node.h5obj[slices]
+                        y_data = y_node.h5obj[slices]
 
-                            # Plot the data
-                            self.ax.scatter(
-                                x_data,
-                                y_data,
-                                marker=marker,
-                                color="r",
-                            )
+                        # Plot the data
+                        self.ax.scatter(
+                            x_data,
+                            y_data,
+                            marker=marker,
+                            color="r",
+                        )
 
-                            pb.advance(step=x_data.size)
+                        pb.advance(step=x_data.size)
 
         # Set the labels
         self.ax.set_xlabel(x_label)
@@ -444,6 +447,8 @@ class HistogramPlotter(Plotter):
             node (h5forest.h5_forest.Node):
                 The node to use for the data.
         """
+        from h5forest.h5_forest import get_forest
+
         # Set the plot parameter for the data key
         self.plot_params["data"] = node
 
@@ -453,16 +458,13 @@ class HistogramPlotter(Plotter):
         split_text[2] = f"x-label:     {node.path}"
         self.plot_text = "\n".join(split_text)
 
-        def run_in_thread():
+        def run_in_thread(stop_event):
             # Get the minimum and maximum values for the x and y axes
-            self.x_min, self.x_max = node.get_min_max()
-
-        # Run the thread but don't move on until it's finished
-        self.assign_data_thread = threading.Thread(target=run_in_thread)
+            self.x_min, self.x_max = node.get_min_max(stop_event)
 
-        # Start the thread (we'll join later to ensure its finished when we
+        # Start the worker (we'll join later to ensure its finished when we
         # need it)
-        self.assign_data_thread.start()
+        self.assign_data_thread = get_forest().start_worker(run_in_thread)
 
         return self.plot_text
 
@@ -475,9 +477,10 @@ class HistogramPlotter(Plotter):
             text (str):
                 The text to extract the plot parameters from.
         """
+        from h5forest.h5_forest import get_forest
 
         @error_handler
-        def run_in_thread():
+        def run_in_thread(stop_event):
             """Compute the histogram."""
             # Unpack the node
             node = self.plot_params["data"]
@@ -496,6 +499,10 @@ class HistogramPlotter(Plotter):
                 self.assign_data_thread.join()
                 self.assign_data_thread = None
 
+            # Nothing to do if we've been asked to stop
+            if stop_event.is_set():
+                return
+
             # If we got this far we're ready to go so force a redraw
             get_app().invalidate()
 
@@ -515,8 +522,7 @@ class HistogramPlotter(Plotter):
             # If neither node is not chunked we can just read and grid the data
             if chunks == 1:
                 # Get the data
-                with h5py.File(node.filepath, "r") as hdf:
-                    data = hdf[node.path][...]
+                data = node.h5obj[...]
 
                 # Compute the grid
                 self.hist, _ = np.histogram(data, bins=bins)
@@ -528,40 +534,38 @@ class HistogramPlotter(Plotter):
                 self.hist = np.zeros(nbins)
 
                 # Get the data
-                with h5py.File(node.filepath, "r") as hdf:
-                    data = hdf[node.path]
-
-                    # Loop over the chunks
-                    with ProgressBar(
-                        total=node.size, description="Hist"
-                    ) as pb:
-                        for chunk_index in np.ndindex(*node.n_chunks):
-                            # Get the current slice for each dimension
-                            slices = tuple(
-                                slice(
-                                    c_idx * c_size,
-                                    min((c_idx + 1) * c_size, s),
-                                )
-                                for c_idx, c_size, s in zip(
-                                    chunk_index, node.chunks, node.shape
-                                )
+                data = node.h5obj
+
+                # Loop over the chunks
+                with ProgressBar(total=node.size, description="Hist") as pb:
+                    for chunk_index in np.ndindex(*node.n_chunks):
+                        # Stop between chunks if we've been asked to
+                        if stop_event.is_set():
+                            return
+
+                        # Get the current slice for each dimension
+                        slices = tuple(
+                            slice(
+                                c_idx * c_size,
+                                min((c_idx + 1) * c_size, s),
                             )
+                            for c_idx, c_size, s in zip(
+                                chunk_index, node.chunks, node.shape
+                            )
+                        )
 
-                            # Get the chunk
-                            chunk_data = data[slices]
+                        # Get the chunk
+                        chunk_data = data[slices]
 
-                            # Compute the grid for the chunk
-                            chunk_density, _ = np.histogram(
-                                chunk_data, bins=bins
-                            )
+                        # Compute the grid for the chunk
+                        chunk_density, _ = np.histogram(chunk_data, bins=bins)
 
-                            # Add it to the total
-                            self.hist += chunk_density
+                        # Add it to the total
+                        self.hist += chunk_density
 
-                            pb.advance(step=chunk_data.size)
+                        pb.advance(step=chunk_data.size)
 
-        self.compute_hist_thread = threading.Thread(target=run_in_thread)
-        self.compute_hist_thread.start()
+        self.compute_hist_thread = get_forest().start_worker(run_in_thread)
 
         return self.plot_text
 
@@ -584,6 +588,9 @@ class HistogramPlotter(Plotter):
         x_scale = split_text[3].split(": ")[1].strip()
         y_scale = split_text[4].split(": ")[1].strip()
 
+        # Nested import to avoid paying for pyplot at startup
+        import matplotlib.pyplot as plt
+
         # Create the figure
         self.fig = plt.figure(figsize=(3.5, 3.5))
         self.ax = self.fig.add_subplot(111)
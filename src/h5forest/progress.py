@@ -46,13 +46,13 @@ class ProgressBar:
             total (int):
                 The total number of steps to complete.
         """
-        from h5forest.h5_forest import H5Forest
+        from h5forest.h5_forest import get_forest
 
         self.total_steps = total
         self.max_length = get_window_size()[1] - 4
         self.current_step = 0
         self.description = description
-        self.forest = H5Forest()
+        self.forest = get_forest()
         self.text_area = self.forest.progress_bar_content
 
         self.forest.flag_progress_bar = True
@@ -86,7 +86,7 @@ class ProgressBar:
 
         # Update the text area
         self.text_area.text = f"{bar} | {back}"
-        self.forest.app.invalidate()
+        self.forest.schedule_invalidate()
 
     def __enter__(self):
         """Begin the progress bar."""
@@ -114,7 +114,7 @@ class ProgressBar:
 
         # Cleanup and final update if necessary
         self.forest.flag_progress_bar = False
-        self.forest.app.invalidate()
+        self.forest.schedule_invalidate()
 
     def advance(self, step=1):
         """Advance the progress bar."""
@@ -11,6 +11,7 @@ Example usage:
 """
 
 import h5py
+import numpy as np
 from prompt_toolkit.layout.processors import Processor, Transformation
 
 from h5forest.node import Node
@@ -56,10 +57,20 @@ class Tree:
     Attributes:
         filepath (str):
             The path to the HDF5 file.
+        hdf (h5py.File):
+            The open HDF5 file.
         roots (list):
             A list of the root level nodes in the tree.
         nodes_by_row (list):
             A list of all nodes in the tree by row in the tree output.
+        row_offsets (np.ndarray):
+            The character offset of the start of each row in the tree text.
+        length (int):
+            The length of the tree text.
+        height (int):
+            The height of the tree text (i.e. the number of rows).
+        _last_line_len (int):
+            The length of the final row of the tree text.
     """
 
     def __init__(self, filepath):
@@ -82,30 +93,48 @@ class Tree:
         # Initialise a container to store nodes by row in the tree output
         self.nodes_by_row = []
 
-        # Intialise containers to hold the tree text and split version
-        # to avoid wasted computation
+        # Intialise a container to hold the tree text
         self.tree_text = ""
-        self.tree_text_split = []
+
+        # Initialise the cache of the character offset at the start of each
+        # row (rebuilt whenever the tree text changes). This is used in place
+        # of a split version of the text to find rows
+        self.row_offsets = np.zeros(1, dtype=np.int64)
+
+        # Initialise the derived properties of the tree text, these are only
+        # updated when the tree text changes
+        self.length = 0
+        self.height = 0
+        self._last_line_len = 0
+
+        # Open the file, this is held open for the lifetime of the tree so
+        # each Node can hold on to its open Group/Dataset. We use the latest
+        # file format features (e.g. dense attribute storage) and enlarge
+        # the raw data chunk cache from the 1 MB default
+        self.hdf = h5py.File(
+            self.filepath,
+            "r",
+            libver="latest",
+            rdcc_nbytes=16 * 1024**2,
+            rdcc_nslots=10007,
+        )
+
+        # Start with a larger metadata cache too (2 MB by default) so
+        # repeated attribute and link lookups are served from memory
+        mdc_config = self.hdf.id.get_mdc_config()
+        mdc_config.set_initial_size = True
+        mdc_config.initial_size = 16 * 1024**2
+        mdc_config.max_size = max(mdc_config.max_size, 16 * 1024**2)
+        self.hdf.id.set_mdc_config(mdc_config)
 
         # Get the root of the level
-        with h5py.File(self.filepath, "r") as hdf:
-            self.root = Node(self.filename, hdf, self.filepath)
-            self.root.is_under_cursor = True
+        self.root = Node(self.filename, self.hdf, self.filepath)
+        self.root.is_under_cursor = True
 
         # Store the previous node under the cursor (we need some memory for
         # correct highlighting)
         self.prev_node = self.root
 
-    @property
-    def length(self):
-        """Return the length of the tree text."""
-        return len(self.tree_text)
-
-    @property
-    def height(self):
-        """Return the height of the tree text."""
-        return len(self.nodes_by_row)
-
     @property
     def width(self):
         """
@@ -114,7 +143,127 @@ class Tree:
         Note that this works because every line is padded with spaces to
         the same length.
         """
-        return len(self.tree_text_split[0])
+        return self.row_length(0)
+
+    def _update_text_cache(self):
+        """
+        Rebuild the cached properties of the tree text.
+
+        This must be called whenever the tree text changes. Along with the
+        length, height and final row length this rebuilds the offsets
+        array, which has an entry for the start of every row in the tree
+        text.
+        """
+        # Find the newlines, each row starts one character after the
+        # previous newline (the text ends with a newline so the final entry
+        # is the length of the text). We scan a fixed width (UTF-32)
+        # encoding of the text so array indices are character positions
+        # even with the non-ASCII arrows in the text
+        chars = np.frombuffer(
+            self.tree_text.encode("utf-32-le"),
+            dtype=np.uint32,
+        )
+        newlines = np.nonzero(chars == ord("\n"))[0]
+        self.row_offsets = np.concatenate(
+            (np.zeros(1, dtype=np.int64), newlines + 1)
+        )
+
+        self.length = len(self.tree_text)
+        self.height = len(self.nodes_by_row)
+        self._last_line_len = self.row_length(self.height - 1)
+
+    def row_offset(self, row):
+        """
+        Return the character offset of the start of a row.
+
+        Args:
+            row (int):
+                The row in the tree text.
+
+        Returns:
+            int:
+                The position of the first character of the row.
+        """
+        return int(self.row_offsets[row])
+
+    def row_length(self, row):
+        """
+        Return the length of a row (excluding the newline).
+
+        Args:
+            row (int):
+                The row in the tree text.
+
+        Returns:
+            int:
+                The number of characters in the row.
+        """
+        return int(self.row_offsets[row + 1] - self.row_offsets[row] - 1)
+
+    def row_for_position(self, pos):
+        """
+        Return the row containing a character position.
+
+        This is a binary search over the cached row offsets rather than a
+        scan of the tree text.
+
+        Args:
+            pos (int):
+                The character position in the tree text.
+
+        Returns:
+            int:
+                The row containing pos.
+        """
+        return int(np.searchsorted(self.row_offsets, pos, side="right")) - 1
+
+    def find_key(self, key, start_row):
+        """
+        Find the first row at or after start_row with a key containing key.
+
+        Rather than checking each node in turn this searches the tree text
+        for the key, only checking the node's name on rows where the text
+        matches (the match could be in the indentation or arrow).
+
+        Args:
+            key (str):
+                The string to search for.
+            start_row (int):
+                The row to start searching from.
+
+        Returns:
+            int:
+                The matching row, or None if there is no match.
+        """
+        # Nothing to search if we're past the end
+        if start_row >= self.height:
+            return None
+
+        pos = self.tree_text.find(key, self.row_offset(start_row))
+        while pos != -1:
+            # Which row is this match in?
+            row = int(np.searchsorted(self.row_offsets, pos, side="right")) - 1
+
+            # Is the match in the name?
+            if key in self.nodes_by_row[row].name:
+                return row
+
+            # Continue from the start of the next row
+            if row + 1 >= self.height:
+                break
+            pos = self.tree_text.find(key, self.row_offset(row + 1))
+
+        return None
+
+    def close(self):
+        """
+        Close the HDF5 file.
+
+        Every Node reads through a handle into this file, so this must only
+        be called once nothing else can read from it. In the application
+        H5Forest.run stops and joins all background workers first.
+        """
+        self.hdf.close()
 
     def parse_level(self, parent):
         """
@@ -130,43 +279,47 @@ class Tree:
         # Open this group
         parent.open_node()
 
-    def _get_tree_text_recursive(self, current_node, text, nodes_by_row):
+    def _get_tree_text_recursive(self, current_node, rows, nodes_by_row):
         """
         Parse the open nodes to produce the text tree representation.
 
         This will recurse through the open nodes constructing the output.
+        The rows are collected in a list to be joined once at the end
+        rather than concatenating the text as we go.
 
         Args:
             current_node (Node):
                 The current node to parse.
-            text (str):
-                The current text representation of the tree.
+            rows (list):
+                A list containing the text of each row in the text
+                representation.
             nodes_by_row (list):
                 A list containing the nodes where the index is the row
                 they are on in the text representation.
 
         Returns:
-            str:
-                The text representation of the tree.
+            list:
+                A list containing the text of each row in the text
+                representation.
             list:
                 A list containing the nodes where the index is the row
                 they are on in the text representation.
         """
         # Add this nodes representation
-        text += f"{current_node.to_tree_text()}\n"
+        rows.append(current_node.to_tree_text())
 
         # Append this node to the by row list
         nodes_by_row.append(current_node)
 
         # And include any children
         for child in current_node.children:
-            text, nodes_by_row = self._get_tree_text_recursive(
+            rows, nodes_by_row = self._get_tree_text_recursive(
                 child,
-                text,
+                rows,
                 nodes_by_row,
             )
 
-        return text, nodes_by_row
+        return rows, nodes_by_row
 
     def get_tree_text(self):
         """
@@ -181,20 +334,23 @@ class Tree:
             str:
                 The text representation of the tree.
         """
-        text = ""
+        rows = []
         nodes_by_row = []
-        text, nodes_by_row = self._get_tree_text_recursive(
+        rows, nodes_by_row = self._get_tree_text_recursive(
             self.root,
-            text,
+            rows,
             nodes_by_row,
         )
 
+        # Join the rows into the text (each row ends in a newline)
+        text = "".join(f"{row}\n" for row in rows)
+
         # Store the nodes by row
         self.nodes_by_row = nodes_by_row
 
         # Store the tree text
         self.tree_text = text
-        self.tree_text_split = text.split("\n")
+        self._update_text_cache()
 
         return text
 
@@ -211,21 +367,25 @@ class Tree:
         # Open the parent
         self.parse_level(parent)
 
-        # Update the parent node to reflect that it is now open
-        self.tree_text_split[current_row] = parent.to_tree_text()
-
-        # Create the text and node list for the children ready to insert
-        child_test = [child.to_tree_text() for child in parent.children]
+        # Create the text for the parent (reflecting that it is now open)
+        # followed by its children ready to insert
+        new_text = "".join(
+            f"{node.to_tree_text()}\n" for node in [parent, *parent.children]
+        )
         child_nodes_by_row = [child for child in parent.children]
 
-        # Insert the children into the tree text and nodes by row list
-        self.tree_text_split[current_row + 1 : current_row + 1] = child_test
+        # Insert the children into the nodes by row list
         self.nodes_by_row[current_row + 1 : current_row + 1] = (
             child_nodes_by_row
         )
 
-        # Update the tree text area
-        self.tree_text = "\n".join(self.tree_text_split)
+        # Replace the parent's row in the tree text with the new text
+        self.tree_text = (
+            self.tree_text[: self.row_offset(current_row)]
+            + new_text
+            + self.tree_text[self.row_offset(current_row + 1) :]
+        )
+        self._update_text_cache()
 
         return self.tree_text
 
@@ -248,18 +408,29 @@ class Tree:
         # row list
 
         # We can do this by removing everything between the node and the next
-        # node at the same depth
-        for i, n in enumerate(self.nodes_by_row[current_row + 1 :]):
-            if n.depth <= node.depth:
-                break
-            del self.nodes_by_row[current_row + 1]
-            del self.tree_text_split[current_row + 1]
-
-        # Update the parent node to reflect that it is now closed
-        self.tree_text_split[current_row] = node.to_tree_text()
-
-        # Update the tree text area
-        self.tree_text = "\n".join(self.tree_text_split)
+        # node at the same depth (or the end of the tree), in a single slice
+        end_row = next(
+            (
+                row
+                for row, n in enumerate(
+                    self.nodes_by_row[current_row + 1 :],
+                    start=current_row + 1,
+                )
+                if n.depth <= node.depth
+            ),
+            self.height,
+        )
+        nr_removed = end_row - current_row - 1
+        del self.nodes_by_row[current_row + 1 : end_row]
+
+        # Replace the node's row and its children's rows in the tree text
+        # with the node (reflecting that it is now closed)
+        self.tree_text = (
+            self.tree_text[: self.row_offset(current_row)]
+            + f"{node.to_tree_text()}\n"
+            + self.tree_text[self.row_offset(current_row + 1 + nr_removed) :]
+        )
+        self._update_text_cache()
 
         return self.tree_text
 
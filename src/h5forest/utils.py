@@ -2,6 +2,8 @@
 
 import os
 
+from prompt_toolkit.filters import Filter
+
 
 class DynamicTitle:
     """
@@ -36,6 +38,41 @@ class DynamicTitle:
         self.title = new_title
 
 
+class FlagFilter(Filter):
+    """
+    A filter reading a boolean flag from an object.
+
+    This is a cheaper alternative to wrapping a lambda in a Condition for
+    the filters evaluated on every key press and render.
+
+    Attributes:
+        obj (object):
+            The object holding the flag.
+        name (str):
+            The name of the flag attribute (or property) on obj.
+    """
+
+    def __init__(self, obj, name):
+        """
+        Initialise the filter.
+
+        Args:
+            obj (object): The object holding the flag.
+            name (str): The name of the flag attribute (or property) on obj.
+        """
+        super().__init__()
+        self.obj = obj
+        self.name = name
+
+    def __call__(self):
+        """Return the current value of the flag."""
+        return getattr(self.obj, self.name)
+
+    def __repr__(self):
+        """Return a string representation of the filter."""
+        return f"FlagFilter({self.name})"
+
+
 def get_window_size():
     """
     Get the terminal window size in lines and characters.